@@ -491,15 +491,6 @@ void airye(T z, T &ai, T &aip, T &bi, T &bip) {
     int nz, ierr;
     std::complex<T> cai, caip, cbi, cbip;
 
-    cai.real(NAN);
-    cai.imag(NAN);
-    cbi.real(NAN);
-    cbi.imag(NAN);
-    caip.real(NAN);
-    caip.imag(NAN);
-    cbip.real(NAN);
-    cbip.real(NAN);
-
     if (z < 0) {
         ai = NAN;
     } else {
@@ -728,8 +728,9 @@ inline std::complex<double> cyl_bessel_ie(double v, std::complex<double> z) {
             /* adjust scaling to match zbesi */
             cy_k = detail::rotate(cy_k, -z.imag() / M_PI);
             if (z.real() > 0) {
-                cy_k.real(cy_k.real() * exp(-2 * z.real()));
-                cy_k.imag(cy_k.imag() * exp(-2 * z.real()));
+                double scale = exp(-2 * z.real());
+                cy_k.real(cy_k.real() * scale);
+                cy_k.imag(cy_k.imag() * scale);
             }
             /* v -> -v */
             cy = detail::rotate_i(cy, cy_k, v);
@@ -17,7 +17,7 @@ namespace cephes {
     XSF_HOST_DEVICE inline double besselpoly(double a, double lambda, double nu) {
 
         int m, factor = 0;
-        double Sm, relerr, Sol;
+        double Sm, relerr, Sol, mz, c, d;
         double sum = 0.0;
 
         /* Special handling for a = 0.0 */
@@ -33,12 +33,16 @@ namespace cephes {
             nu = -nu;
             factor = static_cast<int>(nu) % 2;
         }
-        Sm = std::exp(nu * std::log(a)) / (Gamma(nu + 1) * (lambda + nu + 1));
+        /* Loop invariants of the 1F2 term ratio. */
+        mz = -a * a;
+        c = lambda + nu + 1;
+        Sm = std::exp(nu * std::log(a)) / (Gamma(nu + 1) * c);
         m = 0;
         do {
             sum += Sm;
             Sol = Sm;
-            Sm *= -a * a * (lambda + nu + 1 + 2 * m) / ((nu + m + 1) * (m + 1) * (lambda + nu + 1 + 2 * m + 2));
+            d = c + 2 * m;
+            Sm *= mz * d / ((nu + m + 1) * (m + 1) * (d + 2));
             m++;
             relerr = std::abs((Sm - Sol) / Sm);
         } while (relerr > detail::besselpoly_EPS && m < 1000);
@@ -104,6 +104,11 @@ namespace cephes {
         n = px;
         x = x - px;
 
+        /* integer x: the rational approximation is exactly 1 */
+        if (x == 0.0) {
+            return std::ldexp(1.0, n);
+        }
+
         /* rational approximation
          * exp2(x) = 1 +  2xP(xx)/(Q(xx) - P(xx))
          * where xx = x**2
@@ -246,6 +246,7 @@ namespace cephes {
             ;
         } else if ((a < 0) || (p < 0) || (p > 1)) {
             set_error("gammaincinv", SF_ERROR_DOMAIN, NULL);
+            return std::numeric_limits<double>::quiet_NaN();
         } else if (p == 0.0) {
             return 0.0;
         } else if (p == 1.0) {
@@ -283,6 +284,7 @@ namespace cephes {
             return std::numeric_limits<double>::quiet_NaN();
         } else if ((a < 0.0) || (q < 0.0) || (q > 1.0)) {
             set_error("gammainccinv", SF_ERROR_DOMAIN, NULL);
+            return std::numeric_limits<double>::quiet_NaN();
         } else if (q == 0.0) {
             return std::numeric_limits<double>::infinity();
         } else if (q == 1.0) {
@@ -48,6 +48,8 @@ XSF_HOST_DEVICE std::complex<T> sinpi(std::complex<T> z) {
     T exphpiy = std::exp(abspiy / 2);
     T coshfac;
     T sinhfac;
+    /* sinh(y) takes the sign of y, so fold it into the imaginary factor. */
+    T imfac = std::signbit(piy) ? -cospix : cospix;
     if (exphpiy == std::numeric_limits<T>::infinity()) {
         if (sinpix == 0.0) {
             // Preserve the sign of zero.
@@ -55,17 +57,17 @@ XSF_HOST_DEVICE std::complex<T> sinpi(std::complex<T> z) {
         } else {
             coshfac = std::copysign(std::numeric_limits<T>::infinity(), sinpix);
         }
-        if (cospix == 0.0) {
+        if (imfac == 0.0) {
             // Preserve the sign of zero.
-            sinhfac = std::copysign(0.0, cospix);
+            sinhfac = std::copysign(0.0, imfac);
         } else {
-            sinhfac = std::copysign(std::numeric_limits<T>::infinity(), cospix);
+            sinhfac = std::copysign(std::numeric_limits<T>::infinity(), imfac);
         }
         return {coshfac, sinhfac};
     }
 
     coshfac = 0.5 * sinpix * exphpiy;
-    sinhfac = 0.5 * cospix * exphpiy;
+    sinhfac = 0.5 * imfac * exphpiy;
     return {coshfac * exphpiy, sinhfac * exphpiy};
 }
 
@@ -90,24 +92,25 @@ XSF_HOST_DEVICE std::complex<T> cospi(std::complex<T> z) {
     T exphpiy = std::exp(abspiy / 2);
     T coshfac;
     T sinhfac;
+    T imfac = std::signbit(piy) ? sinpix : -sinpix;
     if (exphpiy == std::numeric_limits<T>::infinity()) {
-        if (sinpix == 0.0) {
+        if (cospix == 0.0) {
             // Preserve the sign of zero.
             coshfac = std::copysign(0.0, cospix);
         } else {
             coshfac = std::copysign(std::numeric_limits<T>::infinity(), cospix);
         }
-        if (cospix == 0.0) {
+        if (imfac == 0.0) {
             // Preserve the sign of zero.
-            sinhfac = std::copysign(0.0, sinpix);
+            sinhfac = std::copysign(0.0, imfac);
         } else {
-            sinhfac = std::copysign(std::numeric_limits<T>::infinity(), sinpix);
+            sinhfac = std::copysign(std::numeric_limits<T>::infinity(), imfac);
         }
         return {coshfac, sinhfac};
     }
 
     coshfac = 0.5 * cospix * exphpiy;
-    sinhfac = 0.5 * sinpix * exphpiy;
+    sinhfac = 0.5 * imfac * exphpiy;
     return {coshfac * exphpiy, sinhfac * exphpiy};
 }
 
@@ -0,0 +1,18 @@
+#include "../testing_utils.h"
+#include <tuple>
+#include <xsf/gamma.h>
+
+TEST_CASE("gammaincinv and gammainccinv outside domain", "[gammaincinv][gammainccinv][xsf_tests]") {
+    using test_case = std::tuple<double, double>;
+    auto [a, p] = GENERATE(
+        test_case{0.5, -1e-300}, test_case{1.0, -0.5}, test_case{1.0, 1.5}, test_case{2.0, 1.0000001},
+        test_case{-1.0, 0.5}
+    );
+
+    const double x = xsf::gammaincinv(a, p);
+    const double xc = xsf::gammainccinv(a, p);
+
+    CAPTURE(a, p, x, xc);
+    REQUIRE(std::isnan(x));
+    REQUIRE(std::isnan(xc));
+}
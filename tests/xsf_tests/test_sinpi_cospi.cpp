@@ -0,0 +1,37 @@
+#include "../testing_utils.h"
+#include <complex>
+#include <tuple>
+#include <xsf/trig.h>
+
+TEST_CASE("sinpi and cospi large imaginary part", "[sinpi][cospi][xsf_tests]") {
+    using test_case = std::tuple<std::complex<double>, std::complex<double>, std::complex<double>, double>;
+    using std::complex;
+    // Reference values were computed with the Python library mpmath.
+    auto [z, ref_sin, ref_cos, rtol] = GENERATE(
+        test_case{
+            complex{0.25, 224.0}, complex{1.474885367894269e+305, 1.474885367894269e+305},
+            complex{1.474885367894269e+305, -1.474885367894269e+305}, 1e-12
+        },
+        test_case{
+            complex{0.25, -224.0}, complex{1.474885367894269e+305, -1.474885367894269e+305},
+            complex{1.474885367894269e+305, 1.474885367894269e+305}, 1e-12
+        },
+        test_case{
+            complex{-0.3, 225.5}, complex{-1.8784318365471238e+307, 1.3647606152107003e+307},
+            complex{1.3647606152107003e+307, 1.8784318365471238e+307}, 1e-12
+        },
+        test_case{
+            complex{1.7, -225.9}, complex{-6.600031097092742e+307, -4.795203278195755e+307},
+            complex{4.795203278195755e+307, -6.600031097092742e+307}, 1e-12
+        }
+    );
+    const complex s = xsf::sinpi(z);
+    const complex c = xsf::cospi(z);
+    const auto rel_error_sin = xsf::extended_relative_error(s, ref_sin);
+    const auto rel_error_cos = xsf::extended_relative_error(c, ref_cos);
+
+    CAPTURE(z, s, ref_sin, rtol, rel_error_sin);
+    CAPTURE(z, c, ref_cos, rtol, rel_error_cos);
+    REQUIRE(rel_error_sin <= rtol);
+    REQUIRE(rel_error_cos <= rtol);
+}